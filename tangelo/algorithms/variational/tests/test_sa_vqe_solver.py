@@ -157,6 +157,32 @@ class SA_VQESolverTest(unittest.TestCase):
         self.assertAlmostEqual(np.trace(rho), n_elec * (n_elec - 1),
                                msg="Trace of two_rdm does not match n_elec * (n_elec-1)", delta=1e-6)
 
+    def test_get_rdm_h2_rebuild_mapping(self):
+        """Compute RDMs after rebuilding SA-VQE with another qubit mapping. They
+        must not depend on the mapping used in previous calls.
+        """
+
+        var_params = [5.86665842e-06, 5.65317429e-02]
+        vqe_options = {"molecule": mol_H2_sto3g, "ansatz": BuiltInAnsatze.UCCSD, "qubit_mapping": "jw", "ref_states": [[1, 1, 0, 0]]}
+        sa_vqe_solver = SA_VQESolver(vqe_options)
+        sa_vqe_solver.build()
+        sa_vqe_solver.get_rdm(var_params, ref_state=sa_vqe_solver.reference_circuits[0])
+
+        # Rebuild with BK mapping
+        sa_vqe_solver.qubit_mapping = "bk"
+        sa_vqe_solver.ansatz = BuiltInAnsatze.UCCSD
+        sa_vqe_solver.build()
+        one_rdm, two_rdm = sa_vqe_solver.get_rdm(var_params, ref_state=sa_vqe_solver.reference_circuits[0])
+
+        # Reference: SA-VQE only built with BK mapping
+        vqe_options["qubit_mapping"] = "bk"
+        sa_vqe_solver_bk = SA_VQESolver(vqe_options)
+        sa_vqe_solver_bk.build()
+        one_rdm_bk, two_rdm_bk = sa_vqe_solver_bk.get_rdm(var_params, ref_state=sa_vqe_solver_bk.reference_circuits[0])
+
+        np.testing.assert_array_almost_equal(one_rdm, one_rdm_bk)
+        np.testing.assert_array_almost_equal(two_rdm, two_rdm_bk)
+
     def test_custom_vqe(self):
         """SA-VQE with custom optimizer and non-optimal variational parameters."""
 
@@ -34,7 +34,7 @@ from tangelo.toolboxes.ansatz_generator import UCCSD, RUCC, HEA, UpCCGSD, QMF, Q
                                                VariationalCircuitAnsatz
 from tangelo.toolboxes.ansatz_generator._qubit_mf import init_qmf_from_vector
 from tangelo.toolboxes.ansatz_generator.penalty_terms import combined_penalty
-from tangelo.toolboxes.post_processing.bootstrapping import get_resampled_frequencies
+from tangelo.toolboxes.post_processing.bootstrapping import get_frequencies_arrays, get_resampled_expectation_value
 from tangelo.toolboxes.ansatz_generator.fermionic_operators import number_operator, spinz_operator, spin2_operator
 from tangelo.toolboxes.optimizers.rotosolve import rotosolve
 
@@ -162,6 +162,18 @@ class VQESolver:
         self.optimal_var_params = None
         self.builtin_ansatze = set(BuiltInAnsatze)
 
+        # Array representation of the frequencies in self.rdm_freq_dict, reused between bootstrap resamples.
+        self._rdm_freq_arrays = dict()
+        # Qubit operator of each fermionic term used in get_rdm, mapped only once
+        # for a given set of mapping options.
+        self._rdm_qubit_terms = dict()
+
+    def clear_rdm_freq_cache(self):
+        """Discard the arrays built from self.rdm_freq_dict to resample it in
+        get_rdm. Must be called after modifying or replacing the frequencies.
+        """
+        self._rdm_freq_arrays = dict()
+
     def build(self):
         """Build the underlying objects required to run the VQE algorithm
         afterwards.
@@ -426,7 +438,8 @@ class VQESolver:
                 rdm calculation
             resample (bool): Whether to resample saved frequencies. get_rdm with
                 savefrequencies=True must be called or a dictionary for each
-                qubit terms' frequencies must be set to self.rdm_freq_dict
+                qubit terms' frequencies must be set to self.rdm_freq_dict.
+                clear_rdm_freq_cache must be called after modifying them.
             sum_spin (bool): If True, the spin-summed 1-RDM and 2-RDM will be
                 returned. If False, the full 1-RDM and 2-RDM will be returned.
             ref_state (Circuit): A reference state preparation circuit.
@@ -456,6 +469,11 @@ class VQESolver:
             qb_freq_dict = dict()
             qb_expect_dict = dict()
 
+        # Qubit operators mapped in previous calls with the same mapping options
+        mapping_options = (self.qubit_mapping, self.up_then_down, self.molecule.n_active_sos,
+                           self.molecule.n_active_electrons, self.molecule.spin)
+        rdm_qubit_terms = self._rdm_qubit_terms.setdefault(mapping_options, dict())
+
         # Loop over each element of Hamiltonian (non-zero value)
         for key in self.molecule.fermionic_hamiltonian.terms:
             # Ignore constant / empty term
@@ -469,17 +487,20 @@ class VQESolver:
             elif (length == 4):
                 iele, jele, kele, lele = (int(ele[0]) for ele in tuple(key[0:4]))
 
-            # Create the Hamiltonian with the correct key (Set coefficient to one)
-            hamiltonian_temp = FermionOperator(key)
-
-            # Obtain qubit Hamiltonian
-            qubit_hamiltonian2 = fermion_to_qubit_mapping(fermion_operator=hamiltonian_temp,
-                                                          mapping=self.qubit_mapping,
-                                                          n_spinorbitals=self.molecule.n_active_sos,
-                                                          n_electrons=self.molecule.n_active_electrons,
-                                                          up_then_down=self.up_then_down,
-                                                          spin=self.molecule.spin)
-            qubit_hamiltonian2.compress()
+            # Obtain qubit Hamiltonian, reusing the one computed in a previous call if available
+            qubit_hamiltonian2 = rdm_qubit_terms.get(key)
+            if qubit_hamiltonian2 is None:
+                # Create the Hamiltonian with the correct key (Set coefficient to one)
+                hamiltonian_temp = FermionOperator(key)
+
+                qubit_hamiltonian2 = fermion_to_qubit_mapping(fermion_operator=hamiltonian_temp,
+                                                              mapping=self.qubit_mapping,
+                                                              n_spinorbitals=self.molecule.n_active_sos,
+                                                              n_electrons=self.molecule.n_active_electrons,
+                                                              up_then_down=self.up_then_down,
+                                                              spin=self.molecule.spin)
+                qubit_hamiltonian2.compress()
+                rdm_qubit_terms[key] = qubit_hamiltonian2
 
             # Run through each qubit term separately, use previously calculated result for the qubit term or
             # calculate and save results for that qubit term
@@ -494,8 +515,12 @@ class VQESolver:
                         qb_freq_dict[qb_term], _ = self.backend.simulate(full_circuit)
                     if resample:
                         if qb_term not in resampled_expect_dict:
-                            resampled_freq_dict = get_resampled_frequencies(qb_freq_dict[qb_term], self.backend.n_shots)
-                            resampled_expect_dict[qb_term] = self.backend.get_expectation_value_from_frequencies_oneterm(qb_term, resampled_freq_dict)
+                            # Convert frequencies to arrays once, reused until clear_rdm_freq_cache is called
+                            freq_arrays = self._rdm_freq_arrays.get(qb_term)
+                            if freq_arrays is None:
+                                freq_arrays = get_frequencies_arrays(qb_term, qb_freq_dict[qb_term])
+                                self._rdm_freq_arrays[qb_term] = freq_arrays
+                            resampled_expect_dict[qb_term] = get_resampled_expectation_value(*freq_arrays, self.backend.n_shots)
                         expectation = resampled_expect_dict[qb_term]
                     else:
                         if qb_term not in qb_expect_dict:
@@ -512,7 +537,9 @@ class VQESolver:
                 rdm2_spin[iele, lele, jele, kele] += opt_energy2
 
         # save rdm frequency dictionary
-        self.rdm_freq_dict = qb_freq_dict
+        if not resample:
+            self.rdm_freq_dict = qb_freq_dict
+            self.clear_rdm_freq_cache()
 
         if sum_spin:
             rdm1_np = np.zeros((n_mol_orbitals,) * 2, dtype=np.complex128)
@@ -51,6 +51,9 @@ class Gate(dict):
             variational or not.
     """
 
+    # Fixed set of attributes: no per-instance __dict__ is allocated for gates
+    __slots__ = ("name", "target", "control", "parameter", "is_variational")
+
     def __init__(self, name: str, target: Union[int, integer, list, ndarray],
                  control: Union[int, integer, list, ndarray] = None,
                  parameter="", is_variational: bool = False):
@@ -101,8 +104,11 @@ class Gate(dict):
         if len(target) != n_targets:
             raise ValueError(f"Gate {name}: expected {n_targets} target qubits, but got {target}")
 
-        self.__dict__ = {"name": name, "target": target, "control": control,
-                         "parameter": parameter, "is_variational": is_variational}
+        self.name = name
+        self.target = target
+        self.control = control
+        self.parameter = parameter
+        self.is_variational = is_variational
 
     def __str__(self):
         """Print gate information in a somewhat formatted way. Do not print
@@ -123,13 +129,11 @@ class Gate(dict):
     def __eq__(self, other):
         """Define equality (==) operator on gates"""
 
-        ds, do = self.__dict__, other.__dict__
-
-        if any(ds[k] != do[k] for k in ds if k != "parameter"):
+        if any(getattr(self, k) != getattr(other, k) for k in self.__slots__ if k != "parameter"):
             return False
 
-        parameter = round(ds["parameter"] % (2 * pi), 7) if isinstance(ds["parameter"], (float, int)) else ds["parameter"]
-        other_parameter = round(do["parameter"] % (2 * pi), 7) if isinstance(do["parameter"], (float, int)) else do["parameter"]
+        parameter = round(self.parameter % (2 * pi), 7) if isinstance(self.parameter, (float, int)) else self.parameter
+        other_parameter = round(other.parameter % (2 * pi), 7) if isinstance(other.parameter, (float, int)) else other.parameter
 
         return parameter == other_parameter
 
@@ -137,6 +141,19 @@ class Gate(dict):
         """Define inequality (!=) operator on gates"""
         return not (self == other)
 
+    def __getstate__(self):
+        """Gates have no instance dictionary: their attributes are pickled and
+        copied as a dictionary.
+        """
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __setstate__(self, state):
+        """Restore the attributes of a gate, also from the instance dictionary
+        stored by versions defining gates without __slots__.
+        """
+        for k, v in state.items():
+            setattr(self, k, v)
+
     def inverse(self):
         """Return the inverse (adjoint) of a gate.
 
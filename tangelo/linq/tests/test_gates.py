@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import unittest
+import pickle
+from copy import deepcopy
 
 import numpy as np
 
@@ -94,6 +96,21 @@ class TestGates(unittest.TestCase):
         self.assertTrue(g1 == g3)
         self.assertTrue(g2 == g3)
 
+    def test_gate_pickle_copy(self):
+        """ Test that gates without instance dictionary can be pickled and copied """
+
+        gate = Gate("CRZ", 1, control=0, parameter=0.5, is_variational=True)
+        self.assertFalse(hasattr(gate, "__dict__"))
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(gate, pickle.loads(pickle.dumps(gate, protocol=protocol)))
+        self.assertEqual(gate, deepcopy(gate))
+
+        # State stored by gates defined without __slots__
+        gate_restored = Gate.__new__(Gate)
+        gate_restored.__setstate__({"name": "CRZ", "target": [1], "control": [0], "parameter": 0.5, "is_variational": True})
+        self.assertEqual(gate, gate_restored)
+
     def test_too_many_qubits_on_gates(self):
         """ Test the behavior when too many qubits are selected for a gate. """
 
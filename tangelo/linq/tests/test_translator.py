@@ -357,6 +357,67 @@ class TestTranslation(unittest.TestCase):
         # Two abstract circuits are identical if and only if they have identical string representations
         assert(abs_circ_mixed.__str__() == abs_circ_mixed2.__str__())
 
+    @unittest.skipIf("qiskit" not in installed_backends, "Test Skipped: Backend not available \n")
+    def test_openqasm2abs_parameters_roundtrip(self):
+        """ Translate parameters that qiskit expresses with pi to openQASM and back """
+        parameters = [1/(2*np.pi), 2*np.pi, -3*np.pi/4, np.pi**2, 1.5]
+        abs_circ_params = Circuit([Gate("RX", 0, parameter=parameter) for parameter in parameters])
+        abs_circ_params2 = translator._translate_openqasm2abs(translator.translate_openqasm(abs_circ_params))
+
+        for gate, gate2 in zip(abs_circ_params._gates, abs_circ_params2._gates):
+            self.assertEqual(gate.name, gate2.name)
+            self.assertAlmostEqual(gate.parameter, gate2.parameter, places=6)
+
+    def test_openqasm2abs_parameters(self):
+        """ Translate openQASM with parameters expressed as multiples or fractions of pi """
+        openqasm_str = '''OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\ncreg c[2];\nrx(1.5) q[0];\nry(pi/2) q[1];\n'''\
+                       '''rz(-pi/4) q[0];\np(3*pi/4) q[1];\ncrz(-pi) q[0],q[1];\n'''
+        abs_circ_params = translator._translate_openqasm2abs(openqasm_str)
+
+        ref_circ = Circuit([Gate("RX", 0, parameter=1.5), Gate("RY", 1, parameter=np.pi/2),
+                            Gate("RZ", 0, parameter=-np.pi/4), Gate("PHASE", 1, parameter=3*np.pi/4),
+                            Gate("CRZ", 1, control=0, parameter=-np.pi)])
+        assert(abs_circ_params == ref_circ)
+
+        # Other expressions of numbers and pi, as generated by qiskit
+        for parameter, value in [("1/(2*pi)", 1/(2*np.pi)), ("pi*2", 2*np.pi), ("+pi", np.pi), ("pi**2", np.pi**2)]:
+            abs_circ_params = translator._translate_openqasm2abs(openqasm_str.replace("pi/2", parameter))
+            self.assertAlmostEqual(abs_circ_params._gates[1].parameter, value)
+
+        # Arbitrary expressions are not evaluated
+        with self.assertRaises(ValueError):
+            translator._translate_openqasm2abs(openqasm_str.replace("pi/2", "__import__('os')"))
+        for parameter in [".pi", "-.*pi", "pi/0"]:
+            with self.assertRaisesRegex(ValueError, "Parameter"):
+                translator._translate_openqasm2abs(openqasm_str.replace("pi/2", parameter))
+
+        # Unsupported gates are reported as such, even if their parameters can not be parsed
+        with self.assertRaisesRegex(ValueError, "Gate 'u3' not supported"):
+            translator._translate_openqasm2abs(openqasm_str.replace("ry(pi/2)", "u3(pi/2,0,pi)"))
+
+        # Parameters missing from parameterized gates or given to other gates
+        for openqasm_gate in ["rx q[0];", "h(0.3) q[0];"]:
+            with self.assertRaisesRegex(ValueError, "parameter"):
+                translator._translate_openqasm2abs(openqasm_str.replace("rx(1.5) q[0];", openqasm_gate))
+
+    def test_openqasm2abs_header(self):
+        """ Translate openQASM programs whose classical register differs or is missing """
+        openqasm_header = """OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\n"""
+        openqasm_gates = """h q[0];\ncx q[0],q[1];\n"""
+        ref_circ = Circuit([Gate("H", 0), Gate("CNOT", 1, control=0)])
+
+        for openqasm_creg in ["creg c[2];\n", "creg c[1];\n", "creg meas[2];\n", ""]:
+            abs_circ_header = translator._translate_openqasm2abs(openqasm_header + openqasm_creg + openqasm_gates)
+            assert(abs_circ_header == ref_circ)
+
+        # Gate names separated from their qubits by other whitespace characters
+        abs_circ_header = translator._translate_openqasm2abs(openqasm_header + openqasm_gates.replace(" ", "\t"))
+        assert(abs_circ_header == ref_circ)
+
+        # Malformed header statements are reported instead of silently dropping the gates
+        with self.assertRaises(ValueError):
+            translator._translate_openqasm2abs(openqasm_header.replace("include", "inclde") + openqasm_gates)
+
     def test_json_ionq(self):
         """ Translate abstract format to IonQ JSON format """
 
@@ -23,9 +23,22 @@ necessary to account for:
     may also differ.
 """
 
+import ast
+import operator
 import re
 from math import pi
 from tangelo.linq import Gate, Circuit
+from tangelo.linq.gate import PARAMETERIZED_GATES
+
+# Patterns used to parse each line of an OpenQASM program
+_QREG_RE = re.compile(r"qreg q\[(\d+)\];")
+_QIDX_RE = re.compile(r"q\[(\d+)\]")
+_PARAM_RE = re.compile(r"\((.*)\)")
+# Version, include and register declarations, which do not translate into gates
+_HEADER_STATEMENTS = {"OPENQASM", "include", "qreg", "creg"}
+# Operators allowed in parameter expressions, e.g. "-3*pi/4" or "1/(2*pi)" as generated by qiskit
+_PARAM_UNARY_OPS = {ast.USub: operator.neg, ast.UAdd: operator.pos}
+_PARAM_BINARY_OPS = {ast.Mult: operator.mul, ast.Div: operator.truediv, ast.Pow: operator.pow}
 
 
 def get_openqasm_gates():
@@ -47,6 +60,94 @@ def get_openqasm_gates():
     return GATE_OPENQASM
 
 
+# Dictionary of gate mapping, as the reverse dictionary of abs -> openqasm translation
+_GATE_MAPPING = {v: k for k, v in get_openqasm_gates().items()}
+
+
+def _build_single(name, qubit_indices, parameters):
+    return Gate(name, int(qubit_indices[0]), parameter=parameters[0] if parameters else "")
+
+
+# TODO: Rethink the use of enums for gates to set the equality CX=CNOT and enable other refactoring
+def _build_control(name, qubit_indices, parameters):
+    return Gate(name, int(qubit_indices[1]), control=int(qubit_indices[0]), parameter=parameters[0] if parameters else "")
+
+
+def _build_swap(name, qubit_indices, parameters):
+    return Gate(name, [int(qubit_indices[0]), int(qubit_indices[1])])
+
+
+def _build_cswap(name, qubit_indices, parameters):
+    return Gate(name, [int(qubit_indices[1]), int(qubit_indices[2])], control=int(qubit_indices[0]))
+
+
+# Functions building an abstract gate from the qubit indices (as strings) and parameters (possibly none) of an
+# openqasm instruction
+_GATE_BUILDERS = {**{name: _build_single for name in ("h", "x", "y", "z", "s", "t", "measure", "rx", "ry", "rz", "p")},
+                  **{name: _build_control for name in ("cx", "cz", "cy", "crz", "cp")},
+                  "swap": _build_swap,
+                  "cswap": _build_cswap}
+
+
+def _eval_param(node):
+    """ Evaluate a parameter expression node, made only of numbers, pi and the operators allowed above """
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return float(node.value)
+    if isinstance(node, ast.Name) and node.id == "pi":
+        return pi
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _PARAM_UNARY_OPS:
+        return _PARAM_UNARY_OPS[type(node.op)](_eval_param(node.operand))
+    if isinstance(node, ast.BinOp) and type(node.op) in _PARAM_BINARY_OPS:
+        return _PARAM_BINARY_OPS[type(node.op)](_eval_param(node.left), _eval_param(node.right))
+    raise ValueError
+
+
+def _parse_param(s):
+    """ Parse parameter as a float, or as an expression of numbers and pi (e.g. "-3*pi/4", "1/(2*pi)") """
+    try:
+        return float(s)
+    except ValueError:
+        pass
+
+    try:
+        value = _eval_param(ast.parse(s.strip(), mode="eval").body)
+    except (SyntaxError, ValueError, ZeroDivisionError, OverflowError):
+        value = None
+    if not isinstance(value, float):
+        raise ValueError(f"Parameter '{s}' not supported with openqasm translation")
+    return value
+
+
+def _scan_openqasm(openqasm_str):
+    """Tokenize the instructions of an OpenQASM program, skipping the header
+    statements (version, includes and register declarations). No Gate object
+    is built here.
+
+    Args:
+        openqasm_str(str): an OpenQASM program, as a string.
+
+    Yields:
+        tuple: gate name (str), qubit indices (list of str, converted to int
+            by the gate builders) and parameters (list of str, parsed once the
+            gate is known to be supported) of each instruction.
+    """
+
+    for openqasm_gate in openqasm_str.splitlines():
+        if not openqasm_gate.strip():
+            continue
+
+        # Extract gate name, qubit indices and parameter value (single parameter for now)
+        gate_name = openqasm_gate.split(None, 1)[0].partition("(")[0]
+        if gate_name in _HEADER_STATEMENTS:
+            continue
+        qubit_indices = _QIDX_RE.findall(openqasm_gate)
+        parameters = _PARAM_RE.findall(openqasm_gate)
+        # TODO: controlled operation, will need to store value in classical register
+        #  bit_indices = [int(index) for index in re.findall('c\[(\d+)\]', openqasm_gate)]
+
+        yield gate_name, qubit_indices, parameters
+
+
 def translate_openqasm(source_circuit):
     """Take in an abstract circuit, return a OpenQASM 2.0 string using IBM
     Qiskit (they are the reference for OpenQASM).
@@ -81,48 +182,19 @@ def _translate_openqasm2abs(openqasm_str):
         Circuit: corresponding quantum circuit in the abstract format.
     """
 
-    # Get dictionary of gate mapping, as the reverse dictionary of abs -> openqasm translation
-    GATE_OPENQASM = get_openqasm_gates()
-    gate_mapping = {v: k for k, v in GATE_OPENQASM.items()}
-
-    def parse_param(s):
-        """ Parse parameter as either a float or a string if it's not a float """
-        try:
-            return float(s)
-        except ValueError:
-            return s
-
-    # Get number of qubits, extract gate operations
-    n_qubits = int(re.findall('qreg q\[(\d+)\];', openqasm_str)[0])
-    openqasm_gates = openqasm_str.split(f"qreg q[{n_qubits}];\ncreg c[{n_qubits}];")[-1]
-    openqasm_gates = [instruction for instruction in openqasm_gates.split("\n") if instruction]
+    # Get number of qubits
+    n_qubits = int(_QREG_RE.findall(openqasm_str)[0])
 
     # Translate gates
-    abs_circ = Circuit()
-    for openqasm_gate in openqasm_gates:
-
-        # Extract gate name, qubit indices and parameter value (single parameter for now)
-        gate_name = re.split('\s|\(', openqasm_gate)[0]
-        qubit_indices = [int(index) for index in re.findall('q\[(\d+)\]', openqasm_gate)]
-        parameters = [parse_param(index) for index in re.findall('\((.*)\)', openqasm_gate)]
-        # TODO: controlled operation, will need to store value in classical register
-        #  bit_indices = [int(index) for index in re.findall('c\[(\d+)\]', openqasm_gate)]
-
-        if gate_name in {"h", "x", "y", "z", "s", "t", "measure"}:
-            gate = Gate(gate_mapping[gate_name], qubit_indices[0])
-        elif gate_name in {"rx", "ry", "rz", "p"}:
-            gate = Gate(gate_mapping[gate_name], qubit_indices[0], parameter=eval(str(parameters[0])))
-        # TODO: Rethink the use of enums for gates to set the equality CX=CNOT and enable other refactoring
-        elif gate_name in {"cx", "cz", "cy"}:
-            gate = Gate(gate_mapping[gate_name], qubit_indices[1], control=qubit_indices[0])
-        elif gate_name in {"crz", "cp"}:
-            gate = Gate(gate_mapping[gate_name], qubit_indices[1], control=qubit_indices[0], parameter=eval(str(parameters[0])))
-        elif gate_name in {"swap"}:
-            gate = Gate(gate_mapping[gate_name], [qubit_indices[0], qubit_indices[1]])
-        elif gate_name in {"cswap"}:
-            gate = Gate(gate_mapping[gate_name], [qubit_indices[1], qubit_indices[2]], control=qubit_indices[0])
-        else:
+    gates = list()
+    for gate_name, qubit_indices, parameters in _scan_openqasm(openqasm_str):
+        builder = _GATE_BUILDERS.get(gate_name)
+        if builder is None:
             raise ValueError(f"Gate '{gate_name}' not supported with openqasm translation")
-        abs_circ.add_gate(gate)
+        name = _GATE_MAPPING[gate_name]
+        if bool(parameters) != (name in PARAMETERIZED_GATES):
+            raise ValueError(f"Gate '{gate_name}' {'requires' if name in PARAMETERIZED_GATES else 'does not take'} a parameter")
+        parameters = [_parse_param(parameter) for parameter in parameters]
+        gates.append(builder(name, qubit_indices, parameters))
 
-    return abs_circ
+    return Circuit(gates, n_qubits=n_qubits)
@@ -14,8 +14,10 @@
 
 """Employ DMET as a problem decomposition technique."""
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from functools import reduce
+from functools import reduce, partial
+import hashlib
 import numpy as np
 from pyscf import gto, scf
 import scipy
@@ -35,6 +37,24 @@ class Localization(Enum):
     iao = 1
 
 
+def _mean_field_fingerprint(mean_field):
+    """Summarize a converged mean field, in order to detect if it has been
+    recomputed or modified since the orbitals have been localized from it.
+
+    Args:
+        mean_field (pyscf.scf.RHF): The mean field of the full molecule.
+
+    Returns:
+        tuple: The total energy and a digest of the MO coefficients and
+            occupations.
+    """
+
+    digest = hashlib.sha1(np.ascontiguousarray(mean_field.mo_coeff).tobytes())
+    digest.update(np.ascontiguousarray(mean_field.mo_occ).tobytes())
+
+    return mean_field.e_tot, digest.hexdigest()
+
+
 class DMETProblemDecomposition(ProblemDecomposition):
     """DMET single-shot algorithm is used for problem decomposition technique.
     By default, CCSD is used as the electronic structure solver, and Meta-Lowdin
@@ -60,6 +80,9 @@ class DMETProblemDecomposition(ProblemDecomposition):
             options. If only a single dictionary is passed, the same options are
             applied for every solver. This will raise an error if different
             solvers are parsed.
+        n_workers (int): Number of threads used to solve the fragments
+            concurrently. Default is 1 (fragments solved one after another).
+            VQE fragments are always solved one after another.
         verbose (bool) : Flag for DMET verbosity.
     """
 
@@ -78,6 +101,7 @@ class DMETProblemDecomposition(ProblemDecomposition):
                            "optimizer": self._default_optimizer,
                            "initial_chemical_potential": 0.0,
                            "solvers_options": list(),
+                           "n_workers": 1,
                            "verbose": False}
 
         self.builtin_localization = set(Localization)
@@ -95,6 +119,10 @@ class DMETProblemDecomposition(ProblemDecomposition):
         if not self.molecule:
             raise ValueError(f"A SecondQuantizedMolecule object must be provided when instantiating DMETProblemDecomposition.")
 
+        # Localized orbitals already computed from this molecule mean field,
+        # shared with other DMET objects built from the same molecule.
+        self._orbitals_cache = self.molecule.mean_field_cache.setdefault("dmet_orbitals", dict())
+
         # Converting our interface to pyscf.mol.gto and pyscf.scf (used by this
         # code).
         self.mean_field = self.molecule.mean_field
@@ -148,6 +176,9 @@ class DMETProblemDecomposition(ProblemDecomposition):
             if len(self.fragment_solvers) != len(self.fragment_atoms):
                 raise RuntimeError("The number of solvers does not match the number of fragments.")
 
+        if not isinstance(self.n_workers, int) or self.n_workers < 1:
+            raise ValueError("n_workers must be a positive integer.")
+
         # Check that the number of solvers options matches the number of solvers.
         # If there is no options, all default ones are applied.
         # If a single options dictionary is parsed, it is repeated for every solvers.
@@ -211,15 +242,22 @@ class DMETProblemDecomposition(ProblemDecomposition):
         elif not callable(self.electron_localization):
             raise TypeError(f"Invalid electron localization function. Expecting a function.")
 
-        # Construct orbital object.
-        self.orbitals = helpers._orbitals(self.molecule, self.mean_field, range(self.molecule.nao_nr()), self.electron_localization)
+        # Construct orbital object and the 1-RDM for the entire molecule. Reused
+        # if another DMET object has been built for the same molecule and
+        # localization, unless the mean field has changed since.
+        cache_key = (self.molecule.dumps(), self.electron_localization)
+        fingerprint = _mean_field_fingerprint(self.mean_field)
+        cached = self._orbitals_cache.get(cache_key)
+        if cached is None or cached[0] != fingerprint:
+            orbitals = helpers._orbitals(self.molecule, self.mean_field, range(self.molecule.nao_nr()), self.electron_localization)
+            onerdm_low = helpers._low_rdm(orbitals.active_fock, orbitals.number_active_electrons)
+            cached = (fingerprint, orbitals, onerdm_low)
+            self._orbitals_cache[cache_key] = cached
+        _, self.orbitals, self.onerdm_low = cached
 
         # TODO: remove last argument, combining fragments not supported.
         self.orb_list, self.orb_list2, _ = helpers._fragment_constructor(self.molecule, self.fragment_atoms, 0)
 
-        # Calculate the 1-RDM for the entire molecule.
-        self.onerdm_low = helpers._low_rdm(self.orbitals.active_fock, self.orbitals.number_active_electrons)
-
     def simulate(self):
         """Perform DMET loop to optimize the chemical potential. It converges
         when the electron summation across all fragments is the same as the
@@ -284,6 +322,10 @@ class DMETProblemDecomposition(ProblemDecomposition):
         if self.chemical_potential is None:
             raise RuntimeError("No chemical_potential. Have you run a simulation yet?")
 
+        # The frequencies may have been modified since the last call.
+        for solver_fragment in getattr(self, "solver_fragment_dict", dict()).values():
+            solver_fragment.clear_rdm_freq_cache()
+
         # begin resampling
         resampled_energies = np.zeros(n_resamples, dtype=float)
         for i in range(n_resamples):
@@ -377,9 +419,6 @@ class DMETProblemDecomposition(ProblemDecomposition):
             print(" \t----------------")
             print(" ")
 
-        number_of_electron = 0.0
-        energy_temp = 0.0
-
         # Possibly add dictionary of measured frequencies for each fragment
         if resample:
             if save_results:
@@ -397,63 +436,84 @@ class DMETProblemDecomposition(ProblemDecomposition):
             self.solver_fragment_dict = dict()
             self.rdm_measurements = dict()
 
-        # Iterate across all fragment and compute their energies.
-        # The total energy is stored in energy_temp.
-        for i, info_fragment in enumerate(scf_fragments):
+        # Solve all fragments, compute their energies and number of electrons.
+        energy_temp, number_of_electron, fragment_results = self._simulate_core(scf_fragments, resample=resample, n_shots=n_shots,
+                                                                                purify=purify, rdm_measurements=rdm_measurements)
 
-            # Unpacking the information for the selected fragment.
-            mf_fragment, fock_frag_copy, mol_frag, t_list, one_ele, two_ele, fock = info_fragment
+        for i, (fragment_energy, one_rdm, solver_fragment) in enumerate(fragment_results):
 
-            # Interface with our data strcuture.
-            # We create a dummy SecondQuantizedMolecule with a DMETFragment class.
-            # It has the same important attributes and methods to be used with
-            # functions of this package.
-            dummy_mol = SecondQuantizedDMETFragment(mol_frag, mf_fragment, fock, fock_frag_copy, t_list, one_ele, two_ele)
+            if save_results and self.fragment_solvers[i] == "vqe":
+                self.solver_fragment_dict[i] = solver_fragment
+                self.rdm_measurements[i] = self.solver_fragment_dict[i].rdm_freq_dict
 
+            # Printed once all fragments have been solved, possibly concurrently.
             if self.verbose:
                 print("\t\tFragment Number : # ", i + 1)
                 print("\t\t------------------------")
+                print("\t\tFragment Energy                 = " + "{:17.10f}".format(fragment_energy))
+                print("\t\tNumber of Electrons in Fragment = " + "{:17.10f}".format(np.trace(one_rdm)))
+                print("")
 
-            # TODO: Changing this into something more simple is preferable. There
-            # would be an enum class with every solver in it. After this, we would
-            # define every solver in a list and call them recursively.
-            # FCISolver and CCSDSolver must be taken care of, but this is a PR itself.
-            solver_fragment = self.fragment_solvers[i]
-            solver_options = self.solvers_options[i]
-            if solver_fragment == "fci":
-                solver_fragment = FCISolver(dummy_mol, **solver_options)
-                solver_fragment.simulate()
-                onerdm, twordm = solver_fragment.get_rdm()
-            elif solver_fragment == "ccsd":
-                solver_fragment = CCSDSolver(dummy_mol, **solver_options)
-                solver_fragment.simulate()
-                onerdm, twordm = solver_fragment.get_rdm()
-            elif solver_fragment == "vqe":
-                if resample:
-                    solver_fragment = self.solver_fragment_dict[i]
-                    if rdm_measurements:
-                        if i in rdm_measurements:
-                            solver_fragment.rdm_freq_dict = rdm_measurements[i]
-                        else:
-                            raise KeyError(f"rdm_measurements for fragment {i} are missing")
-                    if n_shots:
-                        solver_fragment.backend.n_shots = n_shots
-                    if solver_fragment.backend.n_shots is None:
-                        raise ValueError("n_shots must be specified in original calculation or in error calculation")
-                else:
-                    system = {"molecule": dummy_mol}
-                    solver_fragment = VQESolver({**system, **solver_options})
-                    solver_fragment.build()
-                    solver_fragment.simulate()
-
-                if purify and solver_fragment.molecule.n_active_electrons == 2:
-                    onerdm, twordm = solver_fragment.get_rdm(solver_fragment.optimal_var_params, resample=resample, sum_spin=False)
-                    onerdm, twordm = mcweeny_purify_2rdm(twordm)
-                else:
-                    onerdm, twordm = solver_fragment.get_rdm(solver_fragment.optimal_var_params, resample=resample)
-                if save_results:
-                    self.solver_fragment_dict[i] = solver_fragment
-                    self.rdm_measurements[i] = self.solver_fragment_dict[i].rdm_freq_dict
+        energy_temp += self.orbitals.core_constant_energy
+        self.dmet_energy = energy_temp.real
+
+        if save_results:
+            self.scf_fragments = scf_fragments
+
+        return number_of_electron - self.orbitals.number_active_electrons
+
+    def _simulate_core(self, scf_fragments, resample=False, n_shots=None, purify=False, rdm_measurements=None):
+        """Solve all fragments and sum up their energies and number of
+        electrons. This is the numeric part of self._oneshot_loop, which is
+        left with the DMET verbose output and the saving of results. The
+        fragment solvers can still print their own output, and the VQE solvers
+        reused for resampling have their number of shots updated.
+
+        Args:
+            scf_fragments (list): Fragments information, as returned by
+                self._build_scf_fragments.
+            resample (bool): If True, the saved frequencies are resampled using
+                bootstrapping.
+            n_shots (int): The number of shots used for resampling.
+            purify (bool): If True, use McWeeny"s purification technique to
+                purify 2-RDM. Only called for fragments with 2 electrons.
+            rdm_measurements (dict): Measured frequencies for each fragment, as
+                described in self._oneshot_loop.
+
+        Returns:
+            float: Sum of the fragment energies (core energy excluded).
+            float: Sum of the number of electrons in the fragments.
+            list: Energy, one-particle RDM and solver object of each fragment.
+        """
+
+        # Solve all fragments. They are independent from each other, and can
+        # therefore be solved concurrently. VQE fragments are the exception: the
+        # VQE optimizer hides its output by replacing the process-wide
+        # sys.stdout, which is not thread-safe. They are solved afterwards, one
+        # after another.
+        solve_fragment = partial(self._solve_fragment, resample=resample, n_shots=n_shots,
+                                 purify=purify, rdm_measurements=rdm_measurements)
+        fragment_solutions = [None] * len(scf_fragments)
+        if self.n_workers > 1:
+            concurrent_ids = [i for i, solver in enumerate(self.fragment_solvers) if solver != "vqe"]
+            with ThreadPoolExecutor(max_workers=self.n_workers) as executor:
+                concurrent_solutions = executor.map(solve_fragment, concurrent_ids, [scf_fragments[i] for i in concurrent_ids])
+                for i, fragment_solution in zip(concurrent_ids, concurrent_solutions):
+                    fragment_solutions[i] = fragment_solution
+        for i, info_fragment in enumerate(scf_fragments):
+            if fragment_solutions[i] is None:
+                fragment_solutions[i] = solve_fragment(i, info_fragment)
+
+        number_of_electron = 0.0
+        energy_temp = 0.0
+        fragment_results = list()
+
+        # Iterate across all fragment and compute their energies.
+        # The total energy is stored in energy_temp.
+        for info_fragment, (onerdm, twordm, solver_fragment) in zip(scf_fragments, fragment_solutions):
+
+            # Unpacking the information for the selected fragment.
+            mf_fragment, fock_frag_copy, mol_frag, t_list, one_ele, two_ele, fock = info_fragment
 
             fragment_energy, _, one_rdm = self._compute_energy(mf_fragment, onerdm, twordm,
                                                                fock_frag_copy, t_list, one_ele,
@@ -465,18 +525,77 @@ class DMETProblemDecomposition(ProblemDecomposition):
             # Sum up the number of electrons.
             number_of_electron += np.trace(one_rdm[: t_list[0], : t_list[0]])
 
-            if self.verbose:
-                print("\t\tFragment Energy                 = " + "{:17.10f}".format(fragment_energy))
-                print("\t\tNumber of Electrons in Fragment = " + "{:17.10f}".format(np.trace(one_rdm)))
-                print("")
+            fragment_results.append((fragment_energy, one_rdm, solver_fragment))
 
-        energy_temp += self.orbitals.core_constant_energy
-        self.dmet_energy = energy_temp.real
+        return energy_temp, number_of_electron, fragment_results
 
-        if save_results:
-            self.scf_fragments = scf_fragments
+    def _solve_fragment(self, i, info_fragment, resample=False, n_shots=None, purify=False, rdm_measurements=None):
+        """Solve a single DMET fragment with its electronic structure solver.
 
-        return number_of_electron - self.orbitals.number_active_electrons
+        Args:
+            i (int): The fragment number.
+            info_fragment (list): Fragment information, as returned by
+                self._build_scf_fragments.
+            resample (bool): If True, the saved frequencies are resampled using
+                bootstrapping.
+            n_shots (int): The number of shots used for resampling.
+            purify (bool): If True, use McWeeny"s purification technique to
+                purify 2-RDM. Only called for fragments with 2 electrons.
+            rdm_measurements (dict): Measured frequencies for each fragment, as
+                described in self._oneshot_loop.
+
+        Returns:
+            numpy.array: One-particle RDM of the fragment.
+            numpy.array: Two-particle RDM of the fragment.
+            solver object: The solver used for this fragment.
+        """
+
+        # Unpacking the information for the selected fragment.
+        mf_fragment, fock_frag_copy, mol_frag, t_list, one_ele, two_ele, fock = info_fragment
+
+        # Interface with our data strcuture.
+        # We create a dummy SecondQuantizedMolecule with a DMETFragment class.
+        # It has the same important attributes and methods to be used with
+        # functions of this package.
+        dummy_mol = SecondQuantizedDMETFragment(mol_frag, mf_fragment, fock, fock_frag_copy, t_list, one_ele, two_ele)
+
+        # TODO: Changing this into something more simple is preferable. There
+        # would be an enum class with every solver in it. After this, we would
+        # define every solver in a list and call them recursively.
+        # FCISolver and CCSDSolver must be taken care of, but this is a PR itself.
+        solver_fragment = self.fragment_solvers[i]
+        solver_options = self.solvers_options[i]
+        if solver_fragment == "fci":
+            solver_fragment = FCISolver(dummy_mol, **solver_options)
+            solver_fragment.simulate()
+            onerdm, twordm = solver_fragment.get_rdm()
+        elif solver_fragment == "ccsd":
+            solver_fragment = CCSDSolver(dummy_mol, **solver_options)
+            solver_fragment.simulate()
+            onerdm, twordm = solver_fragment.get_rdm()
+        elif solver_fragment == "vqe":
+            if resample:
+                solver_fragment = self.solver_fragment_dict[i]
+                # The frequencies in rdm_measurements have been assigned to the solver in _oneshot_loop
+                if rdm_measurements and i not in rdm_measurements:
+                    raise KeyError(f"rdm_measurements for fragment {i} are missing")
+                if n_shots:
+                    solver_fragment.backend.n_shots = n_shots
+                if solver_fragment.backend.n_shots is None:
+                    raise ValueError("n_shots must be specified in original calculation or in error calculation")
+            else:
+                system = {"molecule": dummy_mol}
+                solver_fragment = VQESolver({**system, **solver_options})
+                solver_fragment.build()
+                solver_fragment.simulate()
+
+            if purify and solver_fragment.molecule.n_active_electrons == 2:
+                onerdm, twordm = solver_fragment.get_rdm(solver_fragment.optimal_var_params, resample=resample, sum_spin=False)
+                onerdm, twordm = mcweeny_purify_2rdm(twordm)
+            else:
+                onerdm, twordm = solver_fragment.get_rdm(solver_fragment.optimal_var_params, resample=resample)
+
+        return onerdm, twordm, solver_fragment
 
     def get_resources(self):
         """Estimate the resources required by DMET. Only supports fragments
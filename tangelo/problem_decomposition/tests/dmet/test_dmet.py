@@ -108,6 +108,25 @@ class DMETProblemDecompositionTest(unittest.TestCase):
 
         self.assertAlmostEqual(energy, -0.854379, places=6)
 
+    def test_h4ring_ml_ccsd_minao_n_workers(self):
+        """Tests that solving the fragments concurrently yields the same result
+        as solving them one after another.
+        """
+
+        opt_dmet = {"molecule": mol_H4_doublecation_minao,
+                    "fragment_atoms": [1, 1, 1, 1],
+                    "fragment_solvers": "ccsd",
+                    "electron_localization": Localization.meta_lowdin,
+                    "n_workers": 4,
+                    "verbose": False
+                    }
+
+        dmet_solver = DMETProblemDecomposition(opt_dmet)
+        dmet_solver.build()
+        energy = dmet_solver.simulate()
+
+        self.assertAlmostEqual(energy, -0.854379, places=6)
+
     def test_h4ring_ml_fci_minao(self):
         """ Tests the result from DMET against a value from a reference
         implementation with meta-lowdin localization and FCI solution to
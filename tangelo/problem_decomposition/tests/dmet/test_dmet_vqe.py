@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import unittest
-from copy import copy
+from copy import copy, deepcopy
 
 from tangelo.molecule_library import mol_H4_minao
 from tangelo.problem_decomposition.dmet.dmet_problem_decomposition import Localization, DMETProblemDecomposition
@@ -21,18 +21,23 @@ from tangelo.problem_decomposition.dmet.dmet_problem_decomposition import Locali
 
 class DMETVQETest(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        """DMET options shared by all tests. The molecule (mean field included)
+        is built once, in the molecule library.
+        """
+        cls.opt_dmet = {"molecule": mol_H4_minao,
+                        "fragment_atoms": [1, 1, 1, 1],
+                        "fragment_solvers": ["vqe", "ccsd", "ccsd", "ccsd"],
+                        "electron_localization": Localization.meta_lowdin,
+                        "verbose": False
+                        }
+
     def test_h4ring_vqe_uccsd(self):
         """DMET on H4 ring with fragment size one, using VQE-UCCSD."""
 
-        opt_dmet = {"molecule": mol_H4_minao,
-                    "fragment_atoms": [1, 1, 1, 1],
-                    "fragment_solvers": ["vqe", "ccsd", "ccsd", "ccsd"],
-                    "electron_localization": Localization.meta_lowdin,
-                    "verbose": False
-                    }
-
         # Run DMET
-        dmet = DMETProblemDecomposition(opt_dmet)
+        dmet = DMETProblemDecomposition(self.opt_dmet)
         dmet.build()
         energy = dmet.simulate()
 
@@ -49,26 +54,52 @@ class DMETVQETest(unittest.TestCase):
         self.assertAlmostEqual(bootstrap_energy, -1.9916120594, delta=standard_deviation*4)
         self.assertAlmostEqual(be_using_measurements, -1.9916120594, delta=sd_using_measurements*4)
 
+        # Frequencies modified in place between two calls are taken into account. With a
+        # single outcome per qubit term, resampling is deterministic.
+        rdm_measurements = deepcopy(dmet.rdm_measurements)
+        dmet.energy_error_bars(n_shots=1000, n_resamples=2, rdm_measurements=rdm_measurements)
+        for freq_dict in rdm_measurements[0].values():
+            bitstring = max(freq_dict, key=freq_dict.get)
+            freq_dict.clear()
+            freq_dict[bitstring] = 1.
+        be_in_place, _ = dmet.energy_error_bars(n_shots=1000, n_resamples=2, rdm_measurements=rdm_measurements)
+        be_fresh, sd_fresh = dmet.energy_error_bars(n_shots=1000, n_resamples=2, rdm_measurements=deepcopy(rdm_measurements))
+        self.assertAlmostEqual(sd_fresh, 0.)
+        self.assertAlmostEqual(be_in_place, be_fresh)
+
+    def test_h4ring_vqe_n_workers(self):
+        """DMET on H4 ring with VQE fragments, solving the fragments with
+        several threads.
+        """
+
+        opt_dmet = copy(self.opt_dmet)
+        opt_dmet["fragment_solvers"] = ["vqe", "vqe", "ccsd", "ccsd"]
+        opt_dmet["n_workers"] = 4
+
+        dmet = DMETProblemDecomposition(opt_dmet)
+        dmet.build()
+        energy = dmet.simulate()
+
+        self.assertAlmostEqual(energy, -1.9916120594, delta=1e-3)
+
     def test_h4ring_vqe_resources(self):
         """Resources estimation on H4 ring."""
 
-        opt_dmet = {"molecule": mol_H4_minao,
-                    "fragment_atoms": [1, 1, 1, 1],
-                    "fragment_solvers": ["vqe", "ccsd", "ccsd", "ccsd"],
-                    "electron_localization": Localization.meta_lowdin,
-                    "verbose": False
-                    }
+        opt_dmet = copy(self.opt_dmet)
 
         # Building DMET fragments (with JW).
-        dmet = DMETProblemDecomposition(opt_dmet)
-        dmet.build()
-        resources_jw = dmet.get_resources()
+        dmet_jw = DMETProblemDecomposition(opt_dmet)
+        dmet_jw.build()
+        resources_jw = dmet_jw.get_resources()
 
         # Building DMET fragments (with scBK).
         opt_dmet["solvers_options"] = {"qubit_mapping": "scbk", "initial_var_params": "ones", "up_then_down": True}
-        dmet = DMETProblemDecomposition(opt_dmet)
-        dmet.build()
-        resources_bk = dmet.get_resources()
+        dmet_bk = DMETProblemDecomposition(opt_dmet)
+        dmet_bk.build()
+        resources_bk = dmet_bk.get_resources()
+
+        # The localized orbitals only depend on the molecule and are reused.
+        self.assertIs(dmet_bk.orbitals, dmet_jw.orbitals)
 
         # JW.
         self.assertEqual(resources_jw[0]["qubit_hamiltonian_terms"], 15)
@@ -175,6 +175,10 @@ class SecondQuantizedMolecule(Molecule):
         mo_occ (list of float): Molecular orbital occupancies (between 0.
             and 2.).
         mean_field (pyscf.scf): Mean-field object (used by CCSD and FCI).
+        mean_field_cache (dict): Quantities derived from the mean field by
+            other modules (e.g. DMET localized orbitals), reused by the
+            objects built from this molecule. Emptied when the mean field is
+            computed.
         n_mos (int): Number of molecular orbitals with a given basis set.
         n_sos (int): Number of spin-orbitals with a given basis set.
         active_occupied (list of int): Occupied molecular orbital indexes
@@ -210,6 +214,7 @@ class SecondQuantizedMolecule(Molecule):
     mo_occ: list = field(init=False)
 
     mean_field: scf = field(init=False)
+    mean_field_cache: dict = field(init=False, default_factory=dict, repr=False, compare=False)
 
     n_mos: int = field(init=False)
     n_sos: int = field(init=False)
@@ -293,6 +298,7 @@ class SecondQuantizedMolecule(Molecule):
         self.mean_field = scf.RHF(molecule)
         self.mean_field.verbose = 0
         self.mean_field.kernel()
+        self.mean_field_cache = dict()
 
         if self.symmetry:
             self.mo_symm_ids = list(symm.label_orb_symm(self.mean_field.mol, self.mean_field.mol.irrep_id,
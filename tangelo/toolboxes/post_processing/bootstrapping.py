@@ -13,8 +13,6 @@
 # limitations under the License.
 
 import numpy as np
-from scipy import stats
-from collections import Counter
 
 
 def get_resampled_frequencies(freq_dict, ncount):
@@ -30,29 +28,57 @@ def get_resampled_frequencies(freq_dict, ncount):
         dict: new frequencies dictionary with resampled distribution.
     """
 
-    length_dict = len(freq_dict.keys())
-    xk = np.empty(length_dict, dtype=np.int64)
-    pk = np.empty(length_dict, dtype=float)
+    bitstrings = list(freq_dict.keys())
+    pk = np.fromiter(freq_dict.values(), dtype=float, count=len(bitstrings))
 
-    # Convert to arrays of integers and frequencies and create generator for samples
-    for i, (k, v) in enumerate(freq_dict.items()):
-        xk[i] = int(k, 2)
-        pk[i] = v
-    distr = stats.rv_discrete(name="distr", values=(xk, pk))
+    # Draw the number of occurrences of every bitstring at once, instead of generating individual samples
+    counts = np.random.multinomial(ncount, pk / pk.sum())
+    frequencies = {bitstrings[i]: counts[i] / ncount for i in np.flatnonzero(counts)}
 
-    # Obtain output bitstring string format
-    n_qubits = len(list(freq_dict.keys())[0])
-    format_specifier = "0"+str(n_qubits)+"b"
+    return frequencies
 
-    # Generate samples from distribution. Cut in chunks to ensure samples fit in memory, gradually accumulate
-    chunk_size = 10**7
-    n_chunks = ncount // chunk_size
-    freqs_shots = Counter()
 
-    for i in range(n_chunks+1):
-        this_chunk = ncount % chunk_size if i == n_chunks else chunk_size
-        samples = distr.rvs(size=this_chunk)
-        freqs_shots += Counter(samples)
-    frequencies = {format(k, format_specifier): v / ncount for k, v in freqs_shots.items()}
+def get_frequencies_arrays(term, freq_dict):
+    """Convert a frequencies dictionary measured for a single qubit term into
+    two parallel arrays: the eigenvalue (+1 or -1) of the term for each
+    bitstring, and the corresponding frequencies. Resampling from these arrays
+    avoids going through dictionaries and bitstrings every time.
 
-    return frequencies
+    Args:
+        term (tuple): qubit term, e.g. ((0, "X"), (1, "Y")).
+        freq_dict (dict): dictionary of measurement/sample frequencies (assumed
+            to be in lsq-first format).
+
+    Returns:
+        numpy.array: eigenvalues of the term for each bitstring (float).
+        numpy.array: normalized frequencies of each bitstring (float).
+    """
+
+    bitstrings = "".join(freq_dict.keys()).encode()
+    bits = np.frombuffer(bitstrings, dtype=np.uint8).reshape(len(freq_dict), -1) - ord("0")
+    parities = bits[:, [index for index, _ in term]].sum(axis=1) % 2
+    eigenvalues = 1. - 2. * parities
+
+    pk = np.fromiter(freq_dict.values(), dtype=float, count=len(freq_dict))
+
+    return eigenvalues, pk / pk.sum()
+
+
+def get_resampled_expectation_value(eigenvalues, probabilities, ncount):
+    """Resample ncount measurements from a distribution of bitstrings and
+    return the corresponding expectation value of a qubit term.
+
+    Args:
+        eigenvalues (numpy.array): eigenvalues of the qubit term for each
+            bitstring, as returned by get_frequencies_arrays.
+        probabilities (numpy.array): probability of each bitstring, as returned
+            by get_frequencies_arrays.
+        ncount (int): number of shots/samples to resample.
+
+    Returns:
+        float: resampled expectation value of the qubit term.
+    """
+
+    counts = np.random.multinomial(ncount, probabilities)
+
+    return eigenvalues @ counts / ncount
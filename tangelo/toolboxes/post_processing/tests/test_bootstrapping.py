@@ -0,0 +1,58 @@
+# Copyright 2021 Good Chemistry Company.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from tangelo.linq import Simulator
+from tangelo.toolboxes.post_processing.bootstrapping import get_resampled_frequencies, get_frequencies_arrays, \
+    get_resampled_expectation_value
+
+freq_dict = {"00": 0.5, "01": 0.25, "11": 0.25}
+
+
+class BootstrappingTest(unittest.TestCase):
+
+    def test_resampled_frequencies(self):
+        """Test that resampled frequencies are consistent with the original
+        distribution and the number of shots.
+        """
+        n_shots = 100000
+        resampled = get_resampled_frequencies(freq_dict, n_shots)
+
+        self.assertTrue(set(resampled.keys()) <= set(freq_dict.keys()))
+        self.assertAlmostEqual(sum(resampled.values()), 1., delta=1e-10)
+        for k, v in freq_dict.items():
+            self.assertAlmostEqual(resampled.get(k, 0.), v, delta=1e-2)
+
+    def test_resampled_frequencies_few_shots(self):
+        """Test that frequencies are multiples of 1/n_shots and that
+        bitstrings never drawn are omitted.
+        """
+        resampled = get_resampled_frequencies({"0": 1., "1": 0.}, 10)
+        self.assertEqual(resampled, {"0": 1.})
+
+    def test_frequencies_arrays(self):
+        """Test that the array representation of frequencies gives the same
+        expectation value as the frequencies dictionary.
+        """
+        term = ((0, "X"), (1, "Y"))
+        eigenvalues, probabilities = get_frequencies_arrays(term, freq_dict)
+
+        expectation = Simulator.get_expectation_value_from_frequencies_oneterm(term, freq_dict)
+        self.assertAlmostEqual(eigenvalues @ probabilities, expectation, delta=1e-10)
+        self.assertAlmostEqual(get_resampled_expectation_value(eigenvalues, probabilities, 100000), expectation, delta=2e-2)
+
+
+if __name__ == "__main__":
+    unittest.main()